@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import html
+import json
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +14,7 @@ from sphinx import environment
 from yep_sphinx_extensions.generate_rss import (
     create_rss_feed,
     get_from_doctree,
+    headers_path,
     yep_abstract,
 )
 from yep_sphinx_extensions.yep_processor.html import (
@@ -27,8 +30,12 @@ from yep_sphinx_extensions.yep_processor.transforms import yep_references
 from yep_sphinx_extensions.yep_zero_generator.yep_index_generator import create_yep_zero
 
 if TYPE_CHECKING:
+    from docutils import nodes
     from sphinx.application import Sphinx
 
+# YEPs at the top of the source directory, the only pages in the RSS feed
+_YEP_DOCNAME = re.compile(r"yep-\d{4}")
+
 
 def _update_config_for_builder(app: Sphinx) -> None:
     app.env.document_ids = {}  # For YEPReferenceRoleTitleText
@@ -53,6 +60,14 @@ def _post_build(app: Sphinx, exception: Exception | None) -> None:
     create_rss_feed(app.doctreedir, app.outdir)
 
 
+def _write_yep_headers(app: Sphinx, doctree: nodes.document) -> None:
+    # Write the headers (collected in the YEPHeaders transform) next to the
+    # doctree, so that the RSS feed can read them without unpickling the document
+    docname = app.env.docname
+    if _YEP_DOCNAME.fullmatch(docname) and "headers" in doctree:
+        headers_path(app.doctreedir, docname).write_text(json.dumps(doctree["headers"]), encoding="utf-8")
+
+
 def set_description(
     app: Sphinx, pagename: str, templatename: str, context: dict[str, Any], doctree
 ) -> None:
@@ -104,6 +119,7 @@ def setup(app: Sphinx) -> dict[str, bool]:
     # Register event callbacks
     app.connect("builder-inited", _update_config_for_builder)  # Update configuration values for builder used
     app.connect("env-before-read-docs", create_yep_zero)  # YEP 0 hook
+    app.connect("doctree-read", _write_yep_headers)  # Headers for the RSS feed
     app.connect('html-page-context', set_description)
 
     # Mathematics rendering
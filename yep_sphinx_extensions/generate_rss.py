@@ -4,10 +4,15 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import json
+import os
 import pickle
-from email.utils import format_datetime, getaddresses
-from html import escape
+import re
+from collections.abc import Mapping
+from email.utils import getaddresses
 from pathlib import Path
+from types import MappingProxyType
 
 from docutils import nodes
 
@@ -17,35 +22,80 @@ RSS_DESCRIPTION = (
     "and some meta-information like release procedure and schedules."
 )
 
+# Equivalent to html.escape(..., quote=False), in a single pass
+_RSS_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
+_YEP_DOCTREE_NAME = re.compile(r"yep-\d{4}\.doctree")
+
+RSS_FOOTER = """\
+  </channel>
+</rss>
+"""
+
+
+# English names, as RFC 2822 requires, regardless of locale
+_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(_MONTH_NAMES, start=1)}
+
+
+@functools.lru_cache(maxsize=64)
 def _format_rfc_2822(datetime: dt.datetime) -> str:
-    datetime = datetime.replace(tzinfo=dt.timezone.utc)
-    return format_datetime(datetime, usegmt=True)
+    # Same output as email.utils.format_datetime(..., usegmt=True) for a UTC time
+    return (
+        f"{_DAY_NAMES[datetime.weekday()]}, {datetime.day:02} {_MONTH_NAMES[datetime.month - 1]} "
+        f"{datetime.year:04} {datetime.hour:02}:{datetime.minute:02}:{datetime.second:02} GMT"
+    )
 
 
-document_cache: dict[Path, dict[str, str]] = {}
+def headers_path(doctree_dir: Path | str, docname: str) -> Path:
+    """Return the path of the headers sidecar file written next to a doctree."""
+    return Path(doctree_dir, f"{docname}.headers.json")
 
 
 def get_from_doctree(full_path: Path, text: str) -> str:
-    # Try and retrieve from cache
-    if full_path in document_cache:
-        return document_cache[full_path].get(text, "")
+    # The Abstract needs the node tree, so only load the doctree when asked for it
+    if text == "Abstract":
+        return _load_abstract(full_path)
+    return _load_headers(full_path).get(text, "")
 
-    # Else load doctree
-    document = pickle.loads(full_path.read_bytes())
-    # Store the headers (populated in the YEPHeaders transform)
-    document_cache[full_path] = path_cache = document.get("headers", {})
-    # Store the Abstract
-    path_cache["Abstract"] = yep_abstract(document)
-    # Return the requested key
-    return path_cache.get(text, "")
+
+@functools.lru_cache(maxsize=256)
+def _load_headers(full_path: Path) -> Mapping[str, str]:
+    # Read the headers from the sidecar file (written on doctree-read, see __init__)
+    try:
+        headers = json.loads(headers_path(full_path.parent, full_path.stem).read_bytes())
+    except FileNotFoundError:
+        # Else load doctree (headers populated in the YEPHeaders transform)
+        headers = _load_doctree(full_path).get("headers", {})
+    return MappingProxyType(headers)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_abstract(full_path: Path) -> str:
+    return yep_abstract(_load_doctree(full_path))
+
+
+def _load_doctree(full_path: Path) -> nodes.document:
+    # Unpickle from the file object rather than reading the whole file into memory first
+    with full_path.open("rb") as f:
+        return pickle.load(f)
 
 
 def yep_creation(full_path: Path) -> dt.datetime:
-    created_str = get_from_doctree(full_path, "Created")
+    return _parse_created(get_from_doctree(full_path, "Created"))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_created(created_str: str) -> dt.datetime:
+    # Equivalent to dt.datetime.strptime(created_str, "%d-%b-%Y"), without the
+    # cost of strptime's regex and locale-aware month name lookup
     try:
-        return dt.datetime.strptime(created_str, "%d-%b-%Y")
-    except ValueError:
+        day, month, year = created_str.split("-")
+        if len(day) > 2 or not day.strip().isdigit() or len(year) != 4 or not year.isdigit():
+            return dt.datetime.min
+        return dt.datetime(int(year), _MONTH_NUMBERS[month.lower()], int(day))
+    except (KeyError, ValueError):
         return dt.datetime.min
 
 
@@ -54,24 +104,45 @@ def yep_abstract(document: nodes.document) -> str:
     If not found, return the first paragraph of the introduction.
     """
     introduction = ""
-    for node in document.findall(nodes.section):
-        title_node = node.next_node(nodes.title)
-        if title_node is None:
+    for section in _sections(document):
+        # The title, if present, is always the first child of a section
+        title_node = section[0] if section.children else None
+        if not isinstance(title_node, nodes.title):
             continue
 
-        if title_node.astext() == "Abstract":
-            if (para_node := node.next_node(nodes.paragraph)) is not None:
-                return para_node.astext().strip().replace("\n", " ")
-            return ""
-        if title_node.astext() == "Introduction":
-            introduction = node.next_node(nodes.paragraph).astext().strip().replace("\n", " ")
+        title = title_node.astext()
+        if title == "Abstract":
+            return _first_paragraph(section)
+        if title == "Introduction":
+            introduction = _first_paragraph(section)
 
     return introduction
 
 
-def _generate_items(doctree_dir: Path):
+def _sections(node: nodes.Element):
+    # Walk only the section tree, in document order, rather than visiting
+    # every paragraph and inline node as findall(nodes.section) does
+    for child in node.children:
+        if isinstance(child, nodes.section):
+            yield child
+            yield from _sections(child)
+
+
+def _first_paragraph(section: nodes.section) -> str:
+    if (para_node := section.next_node(nodes.paragraph)) is not None:
+        return para_node.astext().strip().replace("\n", " ")
+    return ""
+
+
+def _scan_yep_doctrees(doctree_dir: Path) -> list[os.DirEntry[str]]:
+    # A single directory scan; DirEntry caches the stat result where the OS provides it
+    with os.scandir(doctree_dir) as entries:
+        return [entry for entry in entries if _YEP_DOCTREE_NAME.fullmatch(entry.name)]
+
+
+def _generate_items(doctrees: list[os.DirEntry[str]]):
     # get list of yeps with creation time (from "Created:" string in yep source)
-    yeps_with_dt = sorted((yep_creation(path), path) for path in doctree_dir.glob("yep-????.doctree"))
+    yeps_with_dt = sorted((yep_creation(path), path) for path in map(Path, doctrees))
 
     # generate rss items for 10 most recent yeps (in reverse order)
     for datetime, full_path in reversed(yeps_with_dt[-10:]):
@@ -92,21 +163,35 @@ def _generate_items(doctree_dir: Path):
 
         item = f"""\
     <item>
-      <title>YEP {yep_num}: {escape(title, quote=False)}</title>
-      <link>{escape(url, quote=False)}</link>
-      <description>{escape(abstract, quote=False)}</description>
-      <author>{escape(joined_authors, quote=False)}</author>
+      <title>YEP {yep_num}: {title.translate(_RSS_ESCAPE)}</title>
+      <link>{url}</link>
+      <description>{abstract.translate(_RSS_ESCAPE)}</description>
+      <author>{joined_authors.translate(_RSS_ESCAPE)}</author>
       <guid isPermaLink="true">{url}</guid>
       <pubDate>{_format_rfc_2822(datetime)}</pubDate>
     </item>"""
         yield item
 
 
+def _rss_feed_is_current(doctrees: list[os.DirEntry[str]], rss_path: Path) -> bool:
+    """Return True if the RSS feed is newer than every YEP doctree."""
+    try:
+        rss_mtime = rss_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(entry.stat().st_mtime_ns < rss_mtime for entry in doctrees)
+
+
 def create_rss_feed(doctree_dir: Path, output_dir: Path):
+    doctrees = _scan_yep_doctrees(doctree_dir)
+    rss_path = Path(output_dir, "yeps.rss")
+    # No YEP was re-read since the feed was written (e.g. a no-op rebuild)
+    if _rss_feed_is_current(doctrees, rss_path):
+        return
+
     # The rss envelope
     last_build_date = _format_rfc_2822(dt.datetime.now(dt.timezone.utc))
-    items = "\n".join(_generate_items(Path(doctree_dir)))
-    output = f"""\
+    header = f"""\
 <?xml version='1.0' encoding='UTF-8'?>
 <rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">
   <channel>
@@ -117,10 +202,20 @@ def create_rss_feed(doctree_dir: Path, output_dir: Path):
     <docs>https://cyber.harvard.edu/rss/rss.html</docs>
     <language>en</language>
     <lastBuildDate>{last_build_date}</lastBuildDate>
-{items}
-  </channel>
-</rss>
 """
 
     # output directory for target HTML files
-    Path(output_dir, "yeps.rss").write_text(output, encoding="utf-8")
+    # Stream the items to a temporary file rather than joining them into one
+    # string, and only move it into place once complete: a truncated feed left
+    # by a failed build would otherwise be newer than every doctree, so current
+    tmp_path = rss_path.with_name(f"{rss_path.name}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=64 * 1024) as f:
+            f.write(header)
+            for item in _generate_items(doctrees):
+                f.write(item)
+                f.write("\n")
+            f.write(RSS_FOOTER)
+        os.replace(tmp_path, rss_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -13,6 +13,18 @@ if TYPE_CHECKING:
     from docutils import transforms
 
 
+# Kept in default_priority order, the order in which docutils applies them
+_TRANSFORMS = tuple(sorted(
+    (
+        yep_headers.YEPHeaders,
+        yep_title.YEPTitle,
+        yep_contents.YEPContents,
+        yep_footer.YEPFooter,
+    ),
+    key=lambda transform: transform.default_priority,
+))
+
+
 class YEPParser(parsers.RSTParser):
     """RST parser with custom YEP transforms."""
 
@@ -24,9 +36,4 @@ class YEPParser(parsers.RSTParser):
 
     def get_transforms(self) -> list[type[transforms.Transform]]:
         """Use our custom YEP transform rules."""
-        return [
-            yep_headers.YEPHeaders,
-            yep_title.YEPTitle,
-            yep_contents.YEPContents,
-            yep_footer.YEPFooter,
-        ]
+        return list(_TRANSFORMS)
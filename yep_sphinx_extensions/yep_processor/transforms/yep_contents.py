@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
 
 from docutils import nodes
 from docutils import transforms
@@ -14,7 +14,7 @@ class YEPContents(transforms.Transform):
     default_priority = 380
 
     def apply(self) -> None:
-        if not Path(self.document["source"]).match("yep-*"):
+        if not os.path.basename(self.document["source"]).startswith("yep-"):
             return  # not a YEP file, exit early
         # Create the contents placeholder section
         contents_section = nodes.section("")
@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 import re
 
 from docutils import nodes
@@ -56,7 +56,7 @@ class YEPHeaders(transforms.Transform):
     default_priority = 330
 
     def apply(self) -> None:
-        if not Path(self.document["source"]).match("yep-*"):
+        if not os.path.basename(self.document["source"]).startswith("yep-"):
             return  # not a YEP file, exit early
 
         if not len(self.document):
@@ -91,11 +91,11 @@ class YEPHeaders(transforms.Transform):
         fields_to_remove = []
         self.document["headers"] = headers = {}
         for field in header:
-            row_attributes = {sub.tagname: sub.rawsource for sub in field}
-            headers[row_attributes["field_name"]] = row_attributes["field_body"]
+            # A field is always a field_name followed by a field_body
+            name_node, body = field
+            headers[name_node.rawsource] = body.rawsource
 
-            name = field[0].astext().lower()
-            body = field[1]
+            name = name_node.astext().lower()
             if len(body) == 0:
                 # body is empty
                 continue
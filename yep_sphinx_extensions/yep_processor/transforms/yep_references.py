@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 from docutils import nodes
 from docutils import transforms
@@ -10,7 +10,7 @@ class YEPReferenceRoleTitleText(transforms.Transform):
     default_priority = 730
 
     def apply(self) -> None:
-        if not Path(self.document["source"]).match("yep-*"):
+        if not os.path.basename(self.document["source"]).startswith("yep-"):
             return  # not a YEP file, exit early
         for node in self.document.findall(nodes.reference):
             if "_title_tuple" not in node:
@@ -1,4 +1,5 @@
-from pathlib import Path
+import functools
+import os
 
 from docutils import nodes
 from docutils import transforms
@@ -15,7 +16,7 @@ class YEPTitle(transforms.Transform):
     default_priority = 335
 
     def apply(self) -> None:
-        if not Path(self.document["source"]).match("yep-*"):
+        if not os.path.basename(self.document["source"]).startswith("yep-"):
             return  # not a YEP file, exit early
 
         # Directory to hold the YEP's RFC2822 header details, to extract a title string
@@ -25,13 +26,15 @@ class YEPTitle(transforms.Transform):
         desired_fields = {"YEP", "Title"}
         fields_to_remove = []
         for field in self.document[0]:
-            # Hold details of the attribute's tag against its details
-            row_attributes = {sub.tagname: sub.rawsource for sub in field}
-            yep_header_details[row_attributes["field_name"]] = row_attributes["field_body"]
+            # A field is always a field_name followed by a field_body
+            name = field[0].astext()
+            if name not in desired_fields:
+                continue
 
+            # Use the raw source so that the title's inline markup is parsed below
+            yep_header_details[name] = field[1].rawsource
             # Store the redundant fields in the table for removal
-            if row_attributes["field_name"] in desired_fields:
-                fields_to_remove.append(field)
+            fields_to_remove.append(field)
 
             # We only need the YEP number and title
             if yep_header_details.keys() >= desired_fields:
@@ -57,10 +60,23 @@ class YEPTitle(transforms.Transform):
             field.parent.remove(field)
 
 
+# Characters that may start inline markup; titles without any are plain text
+_INLINE_MARKUP_CHARS = frozenset("`*_:|[@\\")
+
+
 def _line_to_nodes(text: str) -> list[nodes.Node]:
     """Parse RST string to nodes."""
+    if _INLINE_MARKUP_CHARS.isdisjoint(text):
+        return [nodes.Text(text)]  # no markup, skip parsing
+
     document = utils.new_document("<inline-rst>")
     document.settings.pep_references = document.settings.rfc_references = False  # patch settings
-    states.RSTStateMachine(state_classes=states.state_classes, initial_state="Body").run([text], document)  # do parsing
+    _state_machine().run([text], document)  # do parsing
     roles._roles.pop("", None)  # restore the "default" default role after parsing a document
     return document[0].children
+
+
+@functools.cache
+def _state_machine() -> states.RSTStateMachine:
+    """Create the state machine once and reuse it for every title."""
+    return states.RSTStateMachine(state_classes=states.state_classes, initial_state="Body")
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Iterable, Sequence
+import functools
+import itertools
+from collections.abc import Mapping, Sequence
 from email.parser import HeaderParser
 from pathlib import Path
+from types import MappingProxyType
 
 from yep_sphinx_extensions.yep_zero_generator.constants import ACTIVE_ALLOWED
 from yep_sphinx_extensions.yep_zero_generator.constants import HIDE_STATUS
@@ -31,6 +34,7 @@ class YEP:
     Attributes:
         number : YEP number.
         title : YEP title.
+        rst_safe_title : YEP title with backticks removed, for use in YEP 0.
         yep_type : The type of YEP.  Can only be one of the values from TYPE_VALUES.
         status : The YEP's status.  Value must be found in STATUS_VALUES.
         authors : A list of the authors.
@@ -49,8 +53,7 @@ class YEP:
         self.filename: Path = filename
 
         # Parse the headers.
-        yep_text = filename.read_text(encoding="utf-8")
-        metadata = HeaderParser().parsestr(yep_text)
+        metadata = HeaderParser().parsestr(_read_headers(filename))
         required_header_misses = YEP.required_headers - set(metadata.keys())
         if required_header_misses:
             _raise_yep_error(self, f"YEP is missing required headers {required_header_misses}")
@@ -66,6 +69,8 @@ class YEP:
 
         # Title
         self.title: str = metadata["Title"]
+        # Backticks would end the :yep: role the title is shown in
+        self.rst_safe_title: str = self.title.replace("`", "")
 
         # Type
         self.yep_type: str = metadata["Type"]
@@ -94,10 +99,13 @@ class YEP:
         self.authors: list[_Author] = _parse_author(metadata["Author"])
         if not self.authors:
             raise _raise_yep_error(self, "no authors found", yep_num=True)
+        self._author_names: tuple[str, ...] = tuple(author.full_name for author in self.authors)
+        self._authors_joined = ", ".join(self._author_names)
 
         # Topic (for sub-indices)
         _topic = metadata.get("Topic", "").lower().split(",")
         self.topic: set[str] = {topic for topic_raw in _topic if (topic := topic_raw.strip())}
+        self._topic_joined = ", ".join(sorted(self.topic))
 
         # Other headers
         self.created = metadata["Created"]
@@ -122,12 +130,7 @@ class YEP:
     def __eq__(self, other):
         return self.number == other.number
 
-    @property
-    def _author_names(self) -> Iterable[str]:
-        """An iterator of the authors' full names."""
-        return (author.full_name for author in self.authors)
-
-    @property
+    @functools.cached_property
     def shorthand(self) -> str:
         """Return reStructuredText tooltip for the YEP type and status."""
         type_code = self.yep_type[0].upper()
@@ -136,31 +139,31 @@ class YEP:
         status_code = self.status[0].upper()
         return f":abbr:`{type_code}{status_code} ({self.yep_type}, {self.status})`"
 
-    @property
-    def details(self) -> dict[str, str | int]:
+    @functools.cached_property
+    def details(self) -> Mapping[str, str | int]:
         """Return the line entry for the YEP."""
-        return {
+        return MappingProxyType({
             "number": self.number,
-            "title": self.title,
+            "title": self.rst_safe_title,
             # a tooltip representing the type and status
             "shorthand": self.shorthand,
             # the comma-separated list of authors
-            "authors": ", ".join(self._author_names),
+            "authors": self._authors_joined,
             # The targeted Yocto-Version (if present) or the empty string
             "yocto_version": self.yocto_version or "",
-        }
+        })
 
-    @property
+    @functools.cached_property
     def full_details(self) -> dict[str, str | int | Sequence[str]]:
         """Returns all headers of the YEP as a dict."""
         return {
             "number": self.number,
             "title": self.title,
-            "authors": ", ".join(self._author_names),
+            "authors": self._authors_joined,
             "discussions_to": self.discussions_to,
             "status": self.status,
             "type": self.yep_type,
-            "topic": ", ".join(sorted(self.topic)),
+            "topic": self._topic_joined,
             "created": self.created,
             "yocto_version": self.yocto_version,
             "post_history": self.post_history,
@@ -169,11 +172,17 @@ class YEP:
             "replaces": self.replaces,
             "superseded_by": self.superseded_by,
             # extra non-header keys for use in ``yeps.json``
-            "author_names": tuple(self._author_names),
+            "author_names": self._author_names,
             "url": f"https://JPEWdev.github.io/yeps/yep-{self.number:0>4}/",
         }
 
 
+def _read_headers(filename: Path) -> str:
+    """Return the RFC 2822 header block, stopping at the first blank line."""
+    with filename.open(encoding="utf-8") as f:
+        return "".join(itertools.takewhile(lambda line: line != "\n", f))
+
+
 def _raise_yep_error(yep: YEP, msg: str, yep_num: bool = False) -> None:
     if yep_num:
         raise YEPError(msg, yep.filename, yep_number=yep.number)
@@ -187,20 +196,22 @@ def _parse_author(data: str) -> list[_Author]:
     """Return a list of author names and emails."""
 
     author_list = []
+    # str.replace returns its input unchanged, without copying, when there is no match
     data = (data.replace("\n", " ")
                 .replace(", Jr", jr_placeholder)
                 .rstrip().removesuffix(","))
     for author_email in data.split(", "):
-        if ' <' in author_email:
-            author, email = author_email.removesuffix(">").split(" <")
-        else:
-            author, email = author_email, ""
+        author, sep, email = author_email.rpartition(" <")
+        if not sep:
+            author, email = email, ""
+        elif " <" in author:
+            raise ValueError(f"More than one email address in author {author_email!r}")
 
         author = author.strip()
         if author == "":
             raise ValueError("Name is empty!")
 
         author = author.replace(jr_placeholder, ", Jr")
-        email = email.lower()
+        email = email.removesuffix(">").lower()
         author_list.append(_Author(author, email))
     return author_list
@@ -16,6 +16,13 @@ if TYPE_CHECKING:
 
 def update_sphinx(filename: str, text: str, docnames: list[str], env: BuildEnvironment) -> Path:
     file_path = Path(env.srcdir, f"{filename}.rst")
+    try:
+        unchanged = file_path.read_text(encoding="utf-8") == text
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged and filename in env.all_docs:
+        return file_path  # Sphinx already has this version, don't force a re-read
+
     file_path.write_text(text, encoding="utf-8")
 
     # Add to files for builder
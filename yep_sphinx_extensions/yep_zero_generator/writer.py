@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import io
 from typing import TYPE_CHECKING
 import unicodedata
 
@@ -44,6 +46,20 @@ by the YEP editors, and once assigned are never changed.  The
 the YEP texts represent their historical record.
 """
 
+# Placeholder body row for empty tables, as list-table needs at least one
+_EMPTY_TABLE_ROW = "   * -\n     -\n     -\n     -\n     -"
+
+# The type and status keys only depend on constants, so are built once
+_TYPES_KEY_BLOCK = "\n\n".join(
+    f"* **{type_[0]}** --- *{type_}*: {ABBREVIATED_TYPES[type_]}"
+    for type_ in sorted(TYPE_VALUES)
+)
+_STATUSES_KEY_BLOCK = "\n\n".join(
+    # Draft YEPs have no status displayed, Active shares a key with Accepted
+    f"* **{'<No letter>' if status == STATUS_DRAFT else status[0]}** --- *{status}*: {ABBREVIATED_STATUSES[status]}"
+    for status in sorted(STATUS_VALUES)
+)
+
 
 class YEPZeroWriter:
     # This is a list of reserved YEP numbers.  Reservations are not to be used for
@@ -51,25 +67,31 @@ class YEPZeroWriter:
     # YEP number.  These are for "special" numbers that may be used for semantic,
     # humorous, or other such reasons, e.g. 401, 666, 754.
     #
-    # YEP numbers may only be reserved with the approval of a YEP editor.  Fields
-    # here are the YEP number being reserved and the claimants for the YEP.
-    # Although the output is sorted when YEP 0 is generated, please keep this list
-    # sorted as well.
-    RESERVED = dict()
+    # YEP numbers may only be reserved with the approval of a YEP editor.  Entries
+    # here are (YEP number being reserved, claimants for the YEP) pairs.  The
+    # list is written out as-is when YEP 0 is generated, so keep it sorted by
+    # YEP number.
+    RESERVED: tuple[tuple[int, str], ...] = ()
 
     def __init__(self):
-        self.output: list[str] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard any output so the writer can produce another document."""
+        self._buf = io.StringIO()
+        self._finalized = False
 
     def emit_text(self, content: str) -> None:
-        # Appends content argument to the output list
-        self.output.append(content)
+        # Writes content argument to the output buffer as a line
+        self._buf.write(content)
+        self._buf.write("\n")
 
     def emit_newline(self) -> None:
-        self.output.append("")
+        self._buf.write("\n")
 
     def emit_author_table_separator(self, max_name_len: int) -> None:
         author_table_separator = "=" * max_name_len + "  " + "=" * len("email address")
-        self.output.append(author_table_separator)
+        self.emit_text(author_table_separator)
 
     def emit_yep_row(
         self,
@@ -80,54 +102,59 @@ class YEPZeroWriter:
         authors: str,
         yocto_version: str | None = None,
     ) -> None:
-        self.emit_text(f"   * - {shorthand}")
-        self.emit_text(f"     - :yep:`{number} <{number}>`")
-        self.emit_text(f"     - :yep:`{title.replace('`', '')} <{number}>`")
-        self.emit_text(f"     - {authors}")
-        if yocto_version is not None:
-            self.emit_text(f"     - {yocto_version}")
+        # The title must already be free of backticks, see YEP.rst_safe_title
+        version_cell = "" if yocto_version is None else f"\n     - {yocto_version}"
+        self.emit_text(
+            f"   * - {shorthand}\n"
+            f"     - :yep:`{number} <{number}>`\n"
+            f"     - :yep:`{title} <{number}>`\n"
+            f"     - {authors}{version_cell}"
+        )
 
     def emit_column_headers(self, *, include_version=True) -> None:
         """Output the column headers for the YEP indices."""
-        self.emit_text(".. list-table::")
-        self.emit_text("   :header-rows: 1")
-        self.emit_text("   :widths: auto")
-        self.emit_text("   :class: yep-zero-table")
+        emit = self.emit_text
+        emit(".. list-table::")
+        emit("   :header-rows: 1")
+        emit("   :widths: auto")
+        emit("   :class: yep-zero-table")
         self.emit_newline()
-        self.emit_text("   * - ")
-        self.emit_text("     - YEP")
-        self.emit_text("     - Title")
-        self.emit_text("     - Authors")
+        emit("   * - ")
+        emit("     - YEP")
+        emit("     - Title")
+        emit("     - Authors")
         if include_version:
-            self.emit_text("     - ")  # for Yocto-Version
+            emit("     - ")  # for Yocto-Version
 
     def emit_title(self, text: str, *, symbol: str = "=") -> None:
-        self.output.append(text)
-        self.output.append(symbol * len(text))
-        self.emit_newline()
+        self._buf.write(f"{text}\n{symbol * len(text)}\n\n")
 
     def emit_subtitle(self, text: str) -> None:
         self.emit_title(text, symbol="-")
 
-    def emit_table(self, yeps: list[YEP]) -> None:
-        include_version = any(yep.details["yocto_version"] for yep in yeps)
+    def emit_table(self, yeps: list[YEP], include_version: bool | None = None) -> None:
+        if include_version is None:
+            include_version = any(yep.details["yocto_version"] for yep in yeps)
         self.emit_column_headers(include_version=include_version)
+        emit_row = self.emit_yep_row
         for yep in yeps:
             details = yep.details
-            if not include_version:
-                details.pop("yocto_version")
-            self.emit_yep_row(**details)
+            if include_version:
+                emit_row(**details)
+            else:
+                emit_row(
+                    shorthand=details["shorthand"],
+                    number=details["number"],
+                    title=details["title"],
+                    authors=details["authors"],
+                )
 
-    def emit_yep_category(self, category: str, yeps: list[YEP]) -> None:
+    def emit_yep_category(self, category: str, yeps: list[YEP], include_version: bool | None = None) -> None:
         self.emit_subtitle(category)
-        self.emit_table(yeps)
+        self.emit_table(yeps, include_version)
         # list-table must have at least one body row
         if len(yeps) == 0:
-            self.emit_text("   * -")
-            self.emit_text("     -")
-            self.emit_text("     -")
-            self.emit_text("     -")
-            self.emit_text("     -")
+            self.emit_text(_EMPTY_TABLE_ROW)
         self.emit_newline()
 
     def write_numerical_index(self, yeps: list[YEP]) -> str:
@@ -139,8 +166,7 @@ class YEPZeroWriter:
         self.emit_table(yeps)
         self.emit_newline()
 
-        numerical_index_string = "\n".join(self.output)
-        return numerical_index_string
+        return self._finalize()
 
     def write_yep0(
         self,
@@ -155,8 +181,7 @@ class YEPZeroWriter:
         self.emit_newline()
 
         if len(yeps) == 0:
-            yep0_string = "\n".join(self.output)
-            return yep0_string
+            return self._finalize()
 
         # Introduction
         self.emit_title("Introduction")
@@ -199,6 +224,9 @@ class YEPZeroWriter:
         # YEPs by category
         self.emit_title("Index by Category")
         meta, info, provisional, accepted, open_, finished, historical, deferred, dead = _classify_yeps(yeps)
+        # Each table only has a version column if one of its YEPs has a version;
+        # if none of the YEPs do, the tables need not check this individually
+        include_version = None if any(yep.details["yocto_version"] for yep in yeps) else False
         yep_categories = [
             ("Process and Meta-YEPs", meta),
             ("Other Informational YEPs", info),
@@ -214,7 +242,7 @@ class YEPZeroWriter:
             # For sub-indices, only emit categories with entries.
             # For YEP 0, emit every category, but only with a table when it has entries.
             if len(yeps_in_category) > 0:
-                self.emit_yep_category(category, yeps_in_category)
+                self.emit_yep_category(category, yeps_in_category, include_version)
             elif is_yep0:
                 # emit the category with no table
                 self.emit_subtitle(category)
@@ -227,7 +255,7 @@ class YEPZeroWriter:
         if is_yep0 and self.RESERVED:
             self.emit_title("Reserved YEP Numbers")
             self.emit_column_headers(include_version=False)
-            for number, claimants in sorted(self.RESERVED.items()):
+            for number, claimants in self.RESERVED:
                 self.emit_yep_row(
                     shorthand="",
                     number=number,
@@ -240,116 +268,144 @@ class YEPZeroWriter:
 
         # YEP types key
         self.emit_title("YEP Types Key")
-        for type_ in sorted(TYPE_VALUES):
-            self.emit_text(
-                f"* **{type_[0]}** --- *{type_}*: {ABBREVIATED_TYPES[type_]}"
-            )
-            self.emit_newline()
+        self.emit_text(_TYPES_KEY_BLOCK)
+        self.emit_newline()
 
         self.emit_text(":yep:`More info in YEP 1 <1#yep-types>`.")
         self.emit_newline()
 
         # YEP status key
         self.emit_title("YEP Status Key")
-        for status in sorted(STATUS_VALUES):
-            # Draft YEPs have no status displayed, Active shares a key with Accepted
-            status_code = "<No letter>" if status == STATUS_DRAFT else status[0]
-            self.emit_text(
-                f"* **{status_code}** --- *{status}*: {ABBREVIATED_STATUSES[status]}"
-            )
-            self.emit_newline()
+        self.emit_text(_STATUSES_KEY_BLOCK)
+        self.emit_newline()
 
         self.emit_text(":yep:`More info in YEP 1 <1#yep-review-resolution>`.")
         self.emit_newline()
 
         if is_yep0:
             # YEP owners
+            emit = self.emit_text
             authors_dict = _verify_email_addresses(yeps)
-            max_name_len = max(len(author_name) for author_name in authors_dict)
+            sorted_authors = _sort_authors(authors_dict)
+            max_name_len = max(map(len, sorted_authors))
             self.emit_title("Authors/Owners")
             self.emit_author_table_separator(max_name_len)
-            self.emit_text(f"{'Name':{max_name_len}}  Email Address")
+            # Parse the padded row format once rather than per author
+            author_row = f"{{:{max_name_len}}}  {{}}".format
+            emit(author_row("Name", "Email Address"))
             self.emit_author_table_separator(max_name_len)
-            for author_name in _sort_authors(authors_dict):
+            for author_name in sorted_authors:
                 # Use the email from authors_dict instead of the one from "author" as
                 # the author instance may have an empty email.
-                self.emit_text(f"{author_name:{max_name_len}}  {authors_dict[author_name]}")
+                emit(author_row(author_name, authors_dict[author_name]))
             self.emit_author_table_separator(max_name_len)
             self.emit_newline()
             self.emit_newline()
 
-        yep0_string = "\n".join(self.output)
-        return yep0_string
+        return self._finalize()
+
+    def _finalize(self) -> str:
+        """Return the generated text. Each writer produces one document per reset."""
+        assert not self._finalized, "the output of this writer was already returned"
+        self._finalized = True
+        # Lines are newline-terminated, drop the final one to end like "\n".join(lines).
+        # Trim it in the buffer so the text is only copied out once, then release the
+        # buffer rather than keep a second copy of the document alive.
+        buf = self._buf
+        end = buf.tell()
+        if end:
+            buf.seek(end - 1)
+            buf.truncate()
+        text = buf.getvalue()
+        buf.close()
+        return text
+
+
+# Categories in the order they are returned from _classify_yeps
+_CATEGORIES = ("meta", "info", "provisional", "accepted", "open", "finished", "historical", "deferred", "dead")
+# Informational YEPs which are sorted by their title, see _classify_yeps
+_INFO_BY_TITLE = "info-by-title"
+
+
+def _category(yep_type: str, status: str) -> str | None:
+    """Return the category for a YEP type and status, or None if unsorted."""
+    # Order of 'if' statement important.  Key Status values take precedence
+    # over Type value, and vice-versa.
+    if status == STATUS_DRAFT:
+        return "open"
+    if status == STATUS_DEFERRED:
+        return "deferred"
+    if yep_type == TYPE_PROCESS:
+        if status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+            return "meta"
+        if status in {STATUS_WITHDRAWN, STATUS_REJECTED}:
+            return "dead"
+        return "historical"
+    if status in DEAD_STATUSES:
+        return "dead"
+    if yep_type == TYPE_INFO:
+        return "info" if status == STATUS_ACTIVE else _INFO_BY_TITLE
+    if status == STATUS_PROVISIONAL:
+        return "provisional"
+    if status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+        return "accepted"
+    if status == STATUS_FINAL:
+        return "finished"
+    return None
+
+
+# Lookup table of (type, status) -> category, built once at import
+_CATEGORY_BY_TYPE_STATUS = {
+    (yep_type, status): _category(yep_type, status)
+    for yep_type in TYPE_VALUES
+    for status in STATUS_VALUES
+}
 
 
 def _classify_yeps(yeps: list[YEP]) -> tuple[list[YEP], ...]:
     """Sort YEPs into meta, informational, accepted, open, finished,
     and essentially dead."""
-    meta = []
-    info = []
-    provisional = []
-    accepted = []
-    open_ = []
-    finished = []
-    historical = []
-    deferred = []
-    dead = []
+    categories: dict[str, list[YEP]] = {category: [] for category in _CATEGORIES}
     for yep in yeps:
-        # Order of 'if' statement important.  Key Status values take precedence
-        # over Type value, and vice-versa.
-        if yep.status == STATUS_DRAFT:
-            open_.append(yep)
-        elif yep.status == STATUS_DEFERRED:
-            deferred.append(yep)
-        elif yep.yep_type == TYPE_PROCESS:
-            if yep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
-                meta.append(yep)
-            elif yep.status in {STATUS_WITHDRAWN, STATUS_REJECTED}:
-                dead.append(yep)
-            else:
-                historical.append(yep)
-        elif yep.status in DEAD_STATUSES:
-            dead.append(yep)
-        elif yep.yep_type == TYPE_INFO:
+        category = _CATEGORY_BY_TYPE_STATUS.get((yep.yep_type, yep.status))
+        if category is None:
+            raise YEPError(f"Unsorted ({yep.yep_type}/{yep.status})", yep.filename, yep.number)
+        if category == _INFO_BY_TITLE:
             # Hack until the conflict between the use of "Final"
             # for both API definition YEPs and other (actually
             # obsolete) YEPs is addressed
-            if yep.status == STATUS_ACTIVE or "release schedule" not in yep.title.lower():
-                info.append(yep)
-            else:
-                historical.append(yep)
-        elif yep.status == STATUS_PROVISIONAL:
-            provisional.append(yep)
-        elif yep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
-            accepted.append(yep)
-        elif yep.status == STATUS_FINAL:
-            finished.append(yep)
-        else:
-            raise YEPError(f"Unsorted ({yep.yep_type}/{yep.status})", yep.filename, yep.number)
-    return meta, info, provisional, accepted, open_, finished, historical, deferred, dead
+            category = "historical" if "release schedule" in yep.title.lower() else "info"
+        categories[category].append(yep)
+    return tuple(categories.values())
 
 
 def _verify_email_addresses(yeps: list[YEP]) -> dict[str, str]:
-    authors_dict: dict[str, set[str]] = {}
+    # Each author maps to their one email address (possibly empty), or to
+    # the set of addresses once a second, different one turns up.
+    authors_dict: dict[str, str | set[str]] = {}
     for yep in yeps:
         for author in yep.authors:
-            # If this is the first time we have come across an author, add them.
-            if author.full_name not in authors_dict:
-                authors_dict[author.full_name] = set()
-
-            # If the new email is an empty string, move on.
-            if not author.email:
+            email = author.email
+            seen = authors_dict.get(author.full_name)
+            # If this is the first time we have come across an author, or
+            # they had no email so far, record this one.
+            if not seen:
+                authors_dict[author.full_name] = email
+            # If the new email is an empty string or already known, move on.
+            elif not email or email == seen:
                 continue
-            # If the email has not been seen, add it to the list.
-            authors_dict[author.full_name].add(author.email)
+            elif isinstance(seen, str):
+                authors_dict[author.full_name] = {seen, email}
+            else:
+                seen.add(email)
 
     valid_authors_dict: dict[str, str] = {}
     too_many_emails: list[tuple[str, set[str]]] = []
     for full_name, emails in authors_dict.items():
-        if len(emails) > 1:
+        if isinstance(emails, set):
             too_many_emails.append((full_name, emails))
         else:
-            valid_authors_dict[full_name] = next(iter(emails), "")
+            valid_authors_dict[full_name] = emails
     if too_many_emails:
         err_output = []
         for author, emails in too_many_emails:
@@ -366,6 +422,7 @@ def _sort_authors(authors_dict: dict[str, str]) -> list[str]:
     return sorted(authors_dict, key=_author_sort_by)
 
 
+@functools.lru_cache(maxsize=None)
 def _author_sort_by(author_name: str) -> str:
     """Skip lower-cased words in surname when sorting."""
     surname, *_ = author_name.split(",")
@@ -33,17 +33,12 @@ if TYPE_CHECKING:
 
 
 def _parse_yeps(path: Path) -> list[parser.YEP]:
-    # Read from root directory
-    yeps: list[parser.YEP] = []
-
-    for file_path in path.iterdir():
-        if not file_path.is_file():
-            continue  # Skip directories etc.
-        if file_path.match("yep-0000*"):
-            continue  # Skip pre-existing YEP 0 files
-        if file_path.match("yep-????.rst"):
-            yep = parser.YEP(path.joinpath(file_path).absolute())
-            yeps.append(yep)
+    # Read from root directory, skipping pre-existing YEP 0 files
+    yeps = [
+        parser.YEP(file_path.absolute())
+        for file_path in path.glob("yep-????.rst")
+        if file_path.name != "yep-0000.rst"
+    ]
 
     return sorted(yeps)
 
@@ -53,20 +48,32 @@ def create_yep_json(yeps: list[parser.YEP]) -> str:
 
 
 def write_yeps_json(yeps: list[parser.YEP], path: Path) -> None:
-    # Create yeps.json
-    json_yeps = create_yep_json(yeps)
-    Path(path, "yeps.json").write_text(json_yeps, encoding="utf-8")
+    # Create yeps.json, encoding it once for both copies
+    json_yeps = create_yep_json(yeps).encode("utf-8")
+    _write_if_changed(Path(path, "yeps.json"), json_yeps)
     os.makedirs(os.path.join(path, "api"), exist_ok=True)
-    Path(path, "api", "yeps.json").write_text(json_yeps, encoding="utf-8")
+    _write_if_changed(Path(path, "api", "yeps.json"), json_yeps)
+
+
+def _write_if_changed(file_path: Path, content: bytes) -> None:
+    # Leave unchanged files alone on incremental builds
+    try:
+        if file_path.read_bytes() == content:
+            return
+    except FileNotFoundError:
+        pass
+    file_path.write_bytes(content)
 
 
 def create_yep_zero(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
     yeps = _parse_yeps(Path(app.srcdir))
 
-    numerical_index_text = writer.YEPZeroWriter().write_numerical_index(yeps)
+    yep_zero_writer = writer.YEPZeroWriter()
+    numerical_index_text = yep_zero_writer.write_numerical_index(yeps)
     subindices.update_sphinx("numerical", numerical_index_text, docnames, env)
 
-    yep0_text = writer.YEPZeroWriter().write_yep0(yeps, builder=env.settings["builder"])
+    yep_zero_writer.reset()
+    yep0_text = yep_zero_writer.write_yep0(yeps, builder=env.settings["builder"])
     yep0_path = subindices.update_sphinx("yep-0000", yep0_text, docnames, env)
     yeps.append(parser.YEP(yep0_path))
 